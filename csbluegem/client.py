@@ -24,12 +24,12 @@ from __future__ import annotations
 
 import datetime
 from types import TracebackType
-from typing import TYPE_CHECKING, Dict, Optional, Sequence, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 import aiohttp
 
 from .errors import BadArgument
-from .http import HTTPClient, Route
+from .http import GET_CACHE_SIZE, GET_CACHE_TTL, HTTPClient, Route
 from .types import (
     Item,
     Currency,
@@ -38,12 +38,10 @@ from .types import (
     Order,
     Origin,
     PatternDataResponse,
-    Sale,
-    SearchMeta,
     SearchResponse,
     SortKey,
 )
-from .utils import is_valid_pattern, is_valid_wear
+from .utils import is_valid_pattern, is_valid_wear, to_epoch
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -51,9 +49,86 @@ if TYPE_CHECKING:
 __all__ = ("Client",)
 
 
+_SEARCH_ROUTE = Route("GET", "/search")
+_PATTERN_DATA_ROUTE = Route("GET", "/patterndata")
+_PRICECHECK_ROUTE = Route("GET", "/pricecheck")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _true(_: bool) -> str:
+    return "true"
+
+
+# (query key, transform) for each optional parameter, in the order the values are passed to _build_params.
+_ParamSpec = Tuple[Tuple[str, Callable[[Any], Union[str, float, int]]], ...]
+
+_SEARCH_PARAMS: _ParamSpec = (
+    ("type", _identity),
+    ("pattern", _identity),
+    ("price_min", _identity),
+    ("price_max", _identity),
+    ("wear_min", _identity),
+    ("wear_max", _identity),
+    ("origin", _identity),
+    ("date_min", to_epoch),
+    ("date_max", to_epoch),
+    ("limit", _identity),
+    ("offset", _identity),
+    ("pattern_data", _true),
+)
+
+_PATTERN_DATA_PARAMS: _ParamSpec = (
+    ("pattern", _identity),
+    ("quantity", _true),
+    ("offset", _identity),
+    ("limit", _identity),
+)
+
+
+def _build_params(spec: _ParamSpec, values: Tuple[Any, ...]) -> Dict[str, Union[str, float, int]]:
+    return {key: transform(value) for (key, transform), value in zip(spec, values) if value is not None}
+
+
+def _check_filters(filters: Sequence[Filter]) -> None:
+    for filter in filters:
+        if not filter.is_valid():
+            raise BadArgument(f"a provided filter is invalid: {filter!r}")
+
+
+def _add_filter_params(params: Dict[str, Union[str, float, int]], filters: Sequence[Filter]) -> None:
+    for filter in filters:
+        params[filter._min_param] = filter.min
+        params[filter._max_param] = filter.max
+
+
 class Client:
     """A CSBlueGem Client.
 
+    Parameters
+    ----------
+    session: Optional[:class:`aiohttp.ClientSession`], optional
+        The session to use for requests. If not given, one is created on first use.
+    connector_limit: :class:`int`, optional
+        The maximum number of open connections when no session is given, by default 64.
+    limit_per_host: :class:`int`, optional
+        The maximum number of open connections to the API when no session is given, by default 32.
+    max_concurrency: :class:`int`, optional
+        The maximum number of requests in flight at once, by default 16.
+    shared_session: :class:`bool`, optional
+        Whether to share one session between every client created with this flag instead of
+        creating a new one. The shared session is closed when the last client using it is closed.
+        It is created with the ``connector_limit`` and ``limit_per_host`` of the client that first
+        uses it, the limits given to later clients are not applied to it while it is open.
+        Ignored if ``session`` is given. By default False.
+    cache_ttl: :class:`float`, optional
+        How long, in seconds, identical GET requests are served from memory, by default 60.
+        ``0`` disables the cache.
+    cache_size: :class:`int`, optional
+        The maximum number of responses kept in memory, by default 256. ``0`` disables the cache.
+
     .. container:: operations
 
         .. describe:: async with x:
@@ -66,8 +141,26 @@ class Client:
                     ...
     """
 
-    def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
-        self.http = HTTPClient(session=session)
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        *,
+        connector_limit: int = 64,
+        limit_per_host: int = 32,
+        max_concurrency: int = 16,
+        shared_session: bool = False,
+        cache_ttl: float = GET_CACHE_TTL,
+        cache_size: int = GET_CACHE_SIZE,
+    ) -> None:
+        self.http = HTTPClient(
+            session=session,
+            connector_limit=connector_limit,
+            limit_per_host=limit_per_host,
+            max_concurrency=max_concurrency,
+            shared_session=shared_session,
+            cache_ttl=cache_ttl,
+            cache_size=cache_size,
+        )
 
     async def search(
         self,
@@ -94,6 +187,8 @@ class Client:
 
         Searches for an item on CSBlueGem.
 
+        Identical searches are served from memory for ``cache_ttl`` seconds, see :meth:`clear_cache`.
+
         Parameters
         ----------
         item: :class:`~csbluegem.types.Item`
@@ -120,8 +215,10 @@ class Client:
             Where the sales originated from, None for any. By default None.
         date_min: Optional[:class:`datetime.datetime`], optional
             The earliest a sale can be from, None for no minimum, by default None.
+            Naive datetimes are treated as UTC.
         date_max: Optional[:class:`datetime.datetime`], optional
             The latest a sale can be from, None for no maximum, by default None.
+            Naive datetimes are treated as UTC.
         limit: Optional[:class:`int`], optional
             The maximum number of results to return. None for no limit. By default None.
         offset: Optional[:class:`int`], optional
@@ -147,70 +244,50 @@ class Client:
         :class:`~csbluegem.errors.NotFound`
             The search returned no results.
         """
-        params: Dict[str, Union[str, float, int]] = {
-            "skin": skin.value,
-            "currency": currency.value,
-            "sort": sort.value,
-            "order": order.value,
-        }
-
-        if type is not None:
-            params["type"] = type.value
-
-        if pattern is not None:
-            if not is_valid_pattern(pattern):
-                raise BadArgument("pattern is invalid.")
-
-            params["pattern"] = pattern
-
-        if price_min is not None:
-            params["price_min"] = price_min
-
-        if price_max is not None:
-            params["price_max"] = price_max
-
-        if wear_min is not None:
-            if not is_valid_wear(wear_min):
-                raise BadArgument("float_min is not in range.")
-
-            params["wear_min"] = wear_min
-
-        if wear_max is not None:
-            if not is_valid_wear(wear_max):
-                raise BadArgument("float_max is not in range.")
-
-            params["wear_max"] = wear_max
-
-        if origin is not None:
-            params["origin"] = origin.value
-
-        if date_min is not None:
-            params["date_min"] = int(date_min.timestamp())
+        if not is_valid_pattern(pattern):
+            raise BadArgument("pattern is invalid.")
 
-        if date_max is not None:
-            params["date_max"] = int(date_max.timestamp())
+        if wear_min is not None and not is_valid_wear(wear_min):
+            raise BadArgument("float_min is not in range.")
 
-        if limit is not None:
-            params["limit"] = limit
+        if wear_max is not None and not is_valid_wear(wear_max):
+            raise BadArgument("float_max is not in range.")
 
-        if offset is not None:
-            params["offset"] = offset
+        if filters:
+            _check_filters(filters)
 
-        if pattern_data is True:
-            params["pattern_data"] = "true"
+        params: Dict[str, Union[str, float, int]] = {
+            "skin": skin,
+            "currency": currency,
+            "sort": sort,
+            "order": order,
+        }
+        params.update(
+            _build_params(
+                _SEARCH_PARAMS,
+                (
+                    type,
+                    pattern,
+                    price_min,
+                    price_max,
+                    wear_min,
+                    wear_max,
+                    origin,
+                    date_min,
+                    date_max,
+                    limit,
+                    offset,
+                    pattern_data or None,
+                ),
+            )
+        )
 
         if filters:
-            for filter in filters:
-                if not filter.is_valid():
-                    raise BadArgument(f"a provided filter is invalid: {filter!r}")
-
-                params[f"{filter.type.value}_min"] = filter.min
-                params[f"{filter.type}_max"] = filter.max
+            _add_filter_params(params, filters)
 
-        r = Route("GET", "/search")
-        data = await self.http.request(r, params=params)
+        data = await self.http.request(_SEARCH_ROUTE, params=params)
 
-        return SearchResponse(SearchMeta._from_data(data["meta"]), [Sale._from_data(d) for d in data["sales"]])
+        return SearchResponse._from_data(data)
 
     async def pattern_data(
         self,
@@ -228,6 +305,8 @@ class Client:
 
         Get pattern data for a skin.
 
+        Identical queries are served from memory for ``cache_ttl`` seconds, see :meth:`clear_cache`.
+
         Parameters
         ----------
         item: :class:`~csbluegem.types.Item`
@@ -261,34 +340,23 @@ class Client:
         :class:`~csbluegem.errors.NotFound`
             The search returned no results.
         """
-        params: Dict[str, Union[int, float, str]] = {
-            "skin": item.value,
-            "sort": sort.value,
-            "order": order.value,
-        }
-
-        if pattern is not None:
-            params["pattern"] = pattern
-
-        if quantity is True:
-            params["quantity"] = "true"
-
-        if offset is not None:
-            params["offset"] = offset
+        if not is_valid_pattern(pattern):
+            raise BadArgument("pattern is invalid.")
 
-        if limit is not None:
-            params["limit"] = limit
+        if filters:
+            _check_filters(filters)
 
-        if filters is not None:
-            for filter in filters:
-                if not filter.is_valid():
-                    raise BadArgument(f"a provided filter is invalid: {filter!r}")
+        params: Dict[str, Union[int, float, str]] = {
+            "skin": item,
+            "sort": sort,
+            "order": order,
+        }
+        params.update(_build_params(_PATTERN_DATA_PARAMS, (pattern, quantity or None, offset, limit)))
 
-                params[f"{filter.type.value}_min"] = filter.min
-                params[f"{filter.type}_max"] = filter.max
+        if filters:
+            _add_filter_params(params, filters)
 
-        r = Route("GET", "/patterndata")
-        data = await self.http.request(r, params=params)
+        data = await self.http.request(_PATTERN_DATA_ROUTE, params=params)
 
         return PatternDataResponse._from_data(data)
 
@@ -297,6 +365,8 @@ class Client:
 
         Runs a price check for an item.
 
+        Identical price checks are served from memory for ``cache_ttl`` seconds, see :meth:`clear_cache`.
+
         Parameters
         ----------
         item: :class:`~csbluegem.types.Item`
@@ -329,16 +399,19 @@ class Client:
             raise BadArgument("provided float is invalid.")
 
         params = {
-            "skin": item.value,
+            "skin": item,
             "pattern": pattern,
             "wear": wear,
         }
 
-        r = Route("GET", "/pricecheck")
-        data = await self.http.request(r, params=params)
+        data = await self.http.request(_PRICECHECK_ROUTE, params=params)
 
         return int(data)
 
+    def clear_cache(self) -> None:
+        """Clears the in memory cache of recent responses."""
+        self.http.clear_cache()
+
     async def close(self) -> None:
         """Gracefully close the client."""
         await self.http.close()
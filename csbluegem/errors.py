@@ -31,14 +31,16 @@ __all__ = (
 
 
 class BlueGemError(Exception):
-    pass
+    __slots__ = ()
 
 
 class BadArgument(BlueGemError):
-    pass
+    __slots__ = ()
 
 
 class HTTPException(BlueGemError):
+    __slots__ = ("code", "message")
+
     def __init__(self, code: int, message: str = ""):
         self.code = code
         self.message = message
@@ -46,12 +48,12 @@ class HTTPException(BlueGemError):
 
 
 class NotFound(HTTPException):
-    pass
+    __slots__ = ()
 
 
 class ServerError(HTTPException):
-    pass
+    __slots__ = ()
 
 
 class InvalidRequest(HTTPException):
-    pass
+    __slots__ = ()
@@ -22,43 +22,115 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
+from collections import OrderedDict
 from platform import python_version
-from typing import Any, Dict, Literal, Optional, Union
+from typing import Any, Callable, Dict, Literal, Optional, Tuple, Type, Union
 
 import aiohttp
+from yarl import URL
 
 from .errors import HTTPException, InvalidRequest, NotFound, ServerError
 from .meta import __version__
 
 BASE_URL = "https://api.csbluegem.com/v2"
+DEFAULT_TIMEOUT = 30.0
+GET_CACHE_SIZE = 256
+GET_CACHE_TTL = 60.0
+STATUS_ERRORS: Dict[int, Type[HTTPException]] = {404: NotFound}
 HTTP_METHOD = Literal["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "TRACE", "CONNECT", "OPTIONS"]
 
 
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+loads: Callable[[Union[str, bytes]], Any]
+dumps: Callable[[Any], bytes]
+
 try:
     import orjson  # type: ignore
 except ModuleNotFoundError:
     HAS_ORJSON = False
-    loads = json.loads
-    dumps = json.dumps
+
+    # msgspec works on bytes in C as well, prefer it over the stdlib when orjson is missing.
+    # It is only imported here, so it costs nothing at import time when orjson is installed.
+    try:
+        import msgspec  # type: ignore
+    except ModuleNotFoundError:
+        loads = json.loads
+        dumps = _stdlib_dumps
+    else:
+        # The decoder and encoder are built once and reused rather than set up on every call.
+        loads = msgspec.json.Decoder().decode
+        dumps = msgspec.json.Encoder().encode
 else:
     HAS_ORJSON = True
     loads = orjson.loads
     dumps = orjson.dumps
 
 
-def from_json(string: str) -> Dict[Any, Any]:
+def from_json(string: Union[str, bytes]) -> Dict[Any, Any]:
     return loads(string)
 
 
-def to_string(data: Dict[Any, Any]) -> str | bytes:
+def to_string(data: Dict[Any, Any]) -> bytes:
     return dumps(data)
 
 
+def _create_session(connector_limit: int, limit_per_host: int) -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=connector_limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+    )
+
+
+# Process wide session shared by clients created with shared_session=True.
+# References are counted per session object, so clients still holding a session that was replaced
+# (because it was closed externally) never affect the count of its replacement.
+# Acquiring never awaits and releasing updates the counts before awaiting, so no lock is needed on a single event loop.
+_default_session: Optional[aiohttp.ClientSession] = None
+_shared_session_refs: Dict[aiohttp.ClientSession, int] = {}
+
+
+def _acquire_default_session(connector_limit: int, limit_per_host: int) -> aiohttp.ClientSession:
+    global _default_session
+
+    # The limits only apply when the shared session is created, later clients reuse it as is.
+    if _default_session is None or _default_session.closed:
+        _default_session = _create_session(connector_limit, limit_per_host)
+
+    _shared_session_refs[_default_session] = _shared_session_refs.get(_default_session, 0) + 1
+    return _default_session
+
+
+async def _release_default_session(session: aiohttp.ClientSession) -> None:
+    global _default_session
+
+    refs = _shared_session_refs.get(session, 0) - 1
+    if refs > 0:
+        _shared_session_refs[session] = refs
+        return
+
+    _shared_session_refs.pop(session, None)
+    if session is _default_session:
+        _default_session = None
+
+    await session.close()
+
+
 class Route:
     """Represents a route for the API."""
 
-    __slots__ = ("method", "path")
+    __slots__ = ("method", "path", "url")
 
     def __init__(self, method: HTTP_METHOD, path: str) -> None:
         """An API route definition.
@@ -72,61 +144,161 @@ class Route:
         """
         self.method = method
         self.path = path
+        self.url = URL(BASE_URL + path)
 
 
 class HTTPClient:
     """Handles requests to the API, should not be used externally."""
 
-    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
-        self.base_url = BASE_URL
-        self.session: aiohttp.ClientSession = session or aiohttp.ClientSession()
+    __slots__ = (
+        "shared_session",
+        "connector_limit",
+        "limit_per_host",
+        "max_concurrency",
+        "cache_ttl",
+        "cache_size",
+        "session",
+        "user_agent",
+        "_sem",
+        "_base_headers",
+        "_json_headers",
+        "_get_cache",
+    )
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        *,
+        connector_limit: int = 64,
+        limit_per_host: int = 32,
+        max_concurrency: int = 16,
+        shared_session: bool = False,
+        cache_ttl: float = GET_CACHE_TTL,
+        cache_size: int = GET_CACHE_SIZE,
+    ):
+        self.shared_session = shared_session and session is None
+        self.connector_limit = connector_limit
+        self.limit_per_host = limit_per_host
+        self.max_concurrency = max_concurrency
+        # A ttl or size of 0 disables the GET cache.
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # Created lazily so that they are bound to the running event loop.
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._sem: Optional[asyncio.Semaphore] = None
 
         self.user_agent = f"csbluegem.py v{__version__} - Python-{python_version()} aiohttp-{aiohttp.__version__}"
+        self._base_headers = {"User-Agent": self.user_agent}
+        self._json_headers = {**self._base_headers, "Content-Type": "application/json"}
+
+        # (path, sorted params) -> (expires_at, data)
+        self._get_cache: OrderedDict[Tuple[Any, ...], Tuple[float, Any]] = OrderedDict()
 
     async def close(self) -> None:
-        await self.session.close()
+        if self.session is None:
+            return
+
+        if self.shared_session:
+            session, self.session = self.session, None
+            await _release_default_session(session)
+        else:
+            await self.session.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None:
+            if self.shared_session:
+                self.session = _acquire_default_session(self.connector_limit, self.limit_per_host)
+            else:
+                self.session = _create_session(self.connector_limit, self.limit_per_host)
+
+        return self.session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+
+        return self._sem
+
+    def clear_cache(self) -> None:
+        self._get_cache.clear()
+
+    def _get_cached(self, key: Tuple[Any, ...]) -> Any:
+        try:
+            expires_at, data = self._get_cache[key]
+        except KeyError:
+            return None
+
+        if expires_at < time.monotonic():
+            del self._get_cache[key]
+            return None
+
+        self._get_cache.move_to_end(key)
+        return data
+
+    def _set_cached(self, key: Tuple[Any, ...], data: Any) -> None:
+        cache = self._get_cache
+        now = time.monotonic()
+
+        # Drop expired entries so they do not linger until their key is requested again.
+        for expired in [k for k, (expires_at, _) in cache.items() if expires_at < now]:
+            del cache[expired]
+
+        cache[key] = (now + self.cache_ttl, data)
+        cache.move_to_end(key)
+
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
 
     async def _json_text_or_bytes(self, response: aiohttp.ClientResponse) -> Union[Dict[str, Any], str, bytes]:
-        content_type = response.headers.get("Content-Type")
+        # Parsed by aiohttp, lowercased and without parameters such as charset.
+        content_type = response.content_type
 
         if content_type == "application/octet-stream":
             return await response.read()
 
-        text = await response.text(encoding="utf-8")
-
+        # Both orjson and json accept bytes, skip decoding the body to str first.
         if content_type == "application/json":
-            return from_json(text)
+            return from_json(await response.read())
 
-        return text
+        return await response.text(encoding="utf-8")
 
     async def request(self, route: Route, **kwargs: Any) -> Any:
         method = route.method
-        url = f"{self.base_url}{route.path}"
+        params = kwargs.pop("params", None)
 
-        headers = {
-            "User-Agent": self.user_agent,
-        }
+        # Only bodyless GETs are cached, keyed on the full parameter set.
+        # Cached data is shared between callers and must not be mutated.
+        cache_key = None
+        if method == "GET" and self.cache_ttl > 0 and self.cache_size > 0 and "json" not in kwargs and "data" not in kwargs:
+            cache_key = (route.path, tuple(sorted(params.items())) if params else ())
+            if (cached := self._get_cached(cache_key)) is not None:
+                return cached
 
+        # Serialize bodies ourselves so aiohttp receives bytes it can send as is.
         if "json" in kwargs:
-            headers["Content-Type"] = "application/json"
+            kwargs["data"] = to_string(kwargs.pop("json"))
+            headers = self._json_headers
+        else:
+            headers = self._base_headers
+        url = route.url.with_query(params) if params else route.url
 
-        async with self.session.request(method, url, headers=headers, **kwargs) as resp:
-            status = resp.status
+        async with self._get_semaphore():
+            async with self._get_session().request(method, url, headers=headers, **kwargs) as resp:
+                status = resp.status
 
-            data = await self._json_text_or_bytes(resp)
+                data = await self._json_text_or_bytes(resp)
 
-            if isinstance(data, dict):
-                if (message := data.get("message")) is not None:
+                if isinstance(data, dict) and (message := data.get("message")) is not None:
                     raise InvalidRequest(status, message)
-            else:
-                message = ""
 
-            if status >= 500:
-                raise ServerError(status, message or "")
-            elif status == 404:
-                raise NotFound(status, message or "")
+                if 200 <= status < 300:
+                    if cache_key is not None:
+                        self._set_cached(cache_key, data)
+
+                    return data
 
-            if 200 <= status < 300:
-                return data
+                exc_type = STATUS_ERRORS.get(status) or (ServerError if status >= 500 else None)
+                if exc_type is not None:
+                    raise exc_type(status, "")
 
-            raise HTTPException(status, f"an unexpected error occurred: {message}")
+                raise HTTPException(status, "an unexpected error occurred")
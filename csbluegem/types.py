@@ -23,11 +23,15 @@ SOFTWARE.
 from __future__ import annotations
 
 import datetime
-from dataclasses import dataclass
+import time
+from array import array
 from enum import Enum
-from typing import TYPE_CHECKING, List, Optional, TypedDict
+from operator import attrgetter, itemgetter
+from statistics import fmean, median
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, TypedDict
 
-from .utils import parse_epoch, utcnow
+from .errors import BadArgument
+from .utils import parse_epoch
 
 if TYPE_CHECKING:
     from typing_extensions import NotRequired
@@ -39,7 +43,10 @@ __all__ = (
     "PatternData",
     "SearchMeta",
     "Sale",
+    "SaleColumns",
+    "PriceStats",
     "SearchResponse",
+    "PatternDataColumns",
     "Origin",
     "FilterType",
     "Filter",
@@ -81,7 +88,7 @@ class _APISearchScreenshotsDict(TypedDict):
 
 class _APISearchSaleDict(TypedDict):
     sale_id: str
-    origin: Origin
+    origin: str
     buff_id: int
     date: str
     pattern: int
@@ -117,7 +124,65 @@ class _APIPatternDataResponseDict(TypedDict):
     data: List[_APIPatternDataDict]
 
 
-@dataclass
+class _StrEnum(str, Enum):
+    """An enum whose members are their string values, so they can be sent as query values directly."""
+
+    def __str__(self) -> str:
+        """Returns the value of the member."""
+        return self.value
+
+    @classmethod
+    def of(cls, value: str, /):
+        """Returns the member with the given value.
+
+        Equivalent to calling the enum with the value, but looks the member up directly
+        instead of going through the enum machinery.
+
+        Parameters
+        ----------
+        value: :class:`str`
+            The value of the member.
+
+        Raises
+        ------
+        ValueError
+            No member has this value.
+        """
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__qualname__}") from None
+
+
+class Origin(_StrEnum):
+    """Where a :class:`~csbluegem.types.Sale` originated from."""
+
+    # fmt: off
+    Buff     = "Buff"
+    CSFloat  = "CSFloat"
+    SkinBid  = "SkinBid"
+    BroSkins = "BroSkins"
+    Skinport = "Skinport"
+    C5Game   = "c5game"
+    # fmt: on
+
+
+# Direct value -> member lookups, cheaper than going through EnumMeta.__call__ per sale.
+_ORIGIN_BY_VALUE = {member.value: member for member in Origin}
+
+
+class ItemType(_StrEnum):
+    """The type of an item."""
+
+    # fmt: off
+    StatTrak = "stattrak"
+    Normal   = "normal"
+    # fmt: on
+
+
+_ITEM_TYPE_BY_VALUE = {member.value: member for member in ItemType}
+
+
 class Screenshots:
     """Screenshots for a :class:`~csbluegem.types.Sale`.
 
@@ -135,39 +200,28 @@ class Screenshots:
         A url to the backside inspect link. Only applicable for CSFloat sales.
     """
 
-    __slots__ = ("_inspect", "inspect_playside", "inspect_backside")
+    __slots__ = ("inspect", "inspect_playside", "inspect_backside")
 
-    _inspect: Optional[str]
-    inspect_playside: Optional[str]
-    inspect_backside: Optional[str]
+    def __init__(self, inspect: Optional[str], inspect_playside: Optional[str], inspect_backside: Optional[str]) -> None:
+        # Resolved once here rather than on every access.
+        self.inspect = inspect or inspect_playside or None
+        self.inspect_playside = inspect_playside
+        self.inspect_backside = inspect_backside
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} inspect={self.inspect!r}>"
 
     @classmethod
     def _from_data(cls, data: _APISearchScreenshotsDict, /):
-        inspect = data["inspect"]
-        inspect_playside = data["inspect_playside"]
-        inspect_backside = data["inspect_backside"]
-
-        return cls(inspect, inspect_playside, inspect_backside)
-
-    @property
-    def inspect(self) -> Optional[str]:
-        """Returns an inspect link no matter where the underlying :class:`~csbluegem.types.Sale` originated.
-
-        For CSFloat based Sales, this will return the playside inspect link.
-
-        If no screenshots are available, this property will return None.
-        """
-
-        if self._inspect:
-            return self._inspect
+        # Built once per sale, skip the __init__ call and store the slots directly.
+        self = cls.__new__(cls)
+        self.inspect_playside = data["inspect_playside"]
+        self.inspect_backside = data["inspect_backside"]
+        self.inspect = data["inspect"] or self.inspect_playside or None
 
-        if self.inspect_playside:
-            return self.inspect_playside
+        return self
 
-        return None
 
-
-@dataclass
 class PatternDataScreenshots:
     """Screenshots that may be associated with this :class:`~csbluegem.types.PatternData`.
 
@@ -183,15 +237,22 @@ class PatternDataScreenshots:
 
     __slots__ = ("csbluegem_screenshot", "aq_oiled")
 
-    csbluegem_screenshot: str
-    aq_oiled: str
+    def __init__(self, csbluegem_screenshot: str, aq_oiled: str) -> None:
+        self.csbluegem_screenshot = csbluegem_screenshot
+        self.aq_oiled = aq_oiled
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} csbluegem_screenshot={self.csbluegem_screenshot!r} aq_oiled={self.aq_oiled!r}>"
 
     @classmethod
     def _from_data(cls, data: _APIPatternDataScreenshots, /):
-        return cls(**data)
+        self = cls.__new__(cls)
+        self.csbluegem_screenshot = data["csbluegem_screenshot"]
+        self.aq_oiled = data["aq_oiled"]
+
+        return self
 
 
-@dataclass
 class PatternDataExtra:
     """Extra information provided for pattern data.
 
@@ -211,17 +272,41 @@ class PatternDataExtra:
 
     __slots__ = ("similar_playside", "similar_backside", "csfloat_link", "search")
 
-    similar_playside: str
-    similar_backside: str
-    csfloat_link: str
-    search: str
+    def __init__(self, similar_playside: str, similar_backside: str, csfloat_link: str, search: str) -> None:
+        self.similar_playside = similar_playside
+        self.similar_backside = similar_backside
+        self.csfloat_link = csfloat_link
+        self.search = search
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} search={self.search!r}>"
 
     @classmethod
     def _from_data(cls, data: _APIPatternDataExtras, /):
-        return cls(**data)
+        self = cls.__new__(cls)
+        self.similar_playside = data["similar_playside"]
+        self.similar_backside = data["similar_backside"]
+        self.csfloat_link = data["csfloat_link"]
+        self.search = data["search"]
+
+        return self
+
+
+# The measurements every pattern data payload has, in PatternData field order.
+_PATTERN_DATA_FIELDS = itemgetter(
+    "backside_blue",
+    "backside_contour_blue",
+    "backside_contour_purple",
+    "backside_gold",
+    "backside_purple",
+    "playside_blue",
+    "playside_contour_blue",
+    "playside_contour_purple",
+    "playside_gold",
+    "playside_purple",
+)
 
 
-@dataclass
 class PatternData:
     """Data for a pattern on CSBlueGem.
 
@@ -274,60 +359,81 @@ class PatternData:
         "extra",
     )
 
-    backside_blue: float
-    backside_contour_blue: int
-    backside_contour_purple: int
-    backside_gold: float
-    backside_purple: float
-    playside_blue: float
-    playside_contour_blue: int
-    playside_contour_purple: float
-    playside_gold: float
-    playside_purple: float
-    pattern: Optional[int]
-    quantity: Optional[int]
-    screenshots: Optional[PatternDataScreenshots]
-    extra: Optional[PatternDataExtra]
-
-    @classmethod
-    def _from_data(cls, data: _APIPatternDataDict, /):
-        backside_blue = data["backside_blue"]
-        backside_contour_blue = data["backside_contour_blue"]
-        backside_contour_purple = data["backside_contour_purple"]
-        backside_gold = data["backside_gold"]
-        backside_purple = data["backside_purple"]
-        playside_blue = data["playside_blue"]
-        playside_contour_blue = data["playside_contour_blue"]
-        playside_contour_purple = data["playside_contour_purple"]
-        playside_gold = data["playside_gold"]
-        playside_purple = data["playside_purple"]
-        pattern = data.get("pattern")
-        quantity = data.get("quantity")
-        screenshots_dict = data.get("screenshots")
-        extra_dict = data.get("extra")
-
-        screenshots = PatternDataScreenshots._from_data(screenshots_dict) if screenshots_dict is not None else None
-        extra = PatternDataExtra._from_data(extra_dict) if extra_dict is not None else None
+    def __init__(
+        self,
+        backside_blue: float,
+        backside_contour_blue: int,
+        backside_contour_purple: int,
+        backside_gold: float,
+        backside_purple: float,
+        playside_blue: float,
+        playside_contour_blue: int,
+        playside_contour_purple: float,
+        playside_gold: float,
+        playside_purple: float,
+        pattern: Optional[int],
+        quantity: Optional[int],
+        screenshots: Optional[PatternDataScreenshots],
+        extra: Optional[PatternDataExtra],
+    ) -> None:
+        self.backside_blue = backside_blue
+        self.backside_contour_blue = backside_contour_blue
+        self.backside_contour_purple = backside_contour_purple
+        self.backside_gold = backside_gold
+        self.backside_purple = backside_purple
+        self.playside_blue = playside_blue
+        self.playside_contour_blue = playside_contour_blue
+        self.playside_contour_purple = playside_contour_purple
+        self.playside_gold = playside_gold
+        self.playside_purple = playside_purple
+        self.pattern = pattern
+        self.quantity = quantity
+        self.screenshots = screenshots
+        self.extra = extra
 
-        return cls(
-            backside_blue,
-            backside_contour_blue,
-            backside_contour_purple,
-            backside_gold,
-            backside_purple,
-            playside_blue,
-            playside_contour_blue,
-            playside_contour_purple,
-            playside_gold,
-            playside_purple,
-            pattern,
-            quantity,
-            screenshots,
-            extra,
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} pattern={self.pattern} playside_blue={self.playside_blue} "
+            f"backside_blue={self.backside_blue}>"
         )
 
+    @classmethod
+    def _from_data(
+        cls,
+        data: _APIPatternDataDict,
+        /,
+        _screenshots_from_data=PatternDataScreenshots._from_data,
+        _extra_from_data=PatternDataExtra._from_data,
+        _get_fields=_PATTERN_DATA_FIELDS,
+    ):
+        # Built once per row, skip the __init__ call and store the slots directly.
+        # The nested constructors are bound as defaults so they are local lookups per row.
+        self = cls.__new__(cls)
+        (
+            self.backside_blue,
+            self.backside_contour_blue,
+            self.backside_contour_purple,
+            self.backside_gold,
+            self.backside_purple,
+            self.playside_blue,
+            self.playside_contour_blue,
+            self.playside_contour_purple,
+            self.playside_gold,
+            self.playside_purple,
+        ) = _get_fields(data)
+
+        get = data.get
+        self.pattern = get("pattern")
+        self.quantity = get("quantity")
+
+        screenshots_dict = get("screenshots")
+        extra_dict = get("extra")
+        self.screenshots = _screenshots_from_data(screenshots_dict) if screenshots_dict is not None else None
+        self.extra = _extra_from_data(extra_dict) if extra_dict is not None else None
+
+        return self
+
 
-@dataclass
 class SearchMeta:
     """Metadata about the search.
 
@@ -341,8 +447,12 @@ class SearchMeta:
 
     __slots__ = ("size", "total")
 
-    size: int
-    total: int
+    def __init__(self, size: int, total: int) -> None:
+        self.size = size
+        self.total = total
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={self.size} total={self.total}>"
 
     @classmethod
     def _from_data(cls, data: _APISearchMetaDict, /):
@@ -352,7 +462,21 @@ class SearchMeta:
         return cls(size, total)
 
 
-@dataclass
+# Every required key of a sale, fetched in one C level call.
+_SALE_FIELDS = itemgetter(
+    "buff_id",
+    "csfloat",
+    "wear",
+    "type",
+    "pattern",
+    "price",
+    "epoch",
+    "steam_inspect_link",
+    "origin",
+    "screenshots",
+)
+
+
 class Sale:
     """Represents a record of sale from CSBlueGem
 
@@ -368,16 +492,10 @@ class Sale:
         The type of the item.
     pattern: :class:`int`
         The pattern of the item.
-    timestamp: :class:`datetime.datetime`
-        When the sale occurred.
     steam_inspect_link: :class:`str`
         The inspect link for this item.
     origin: :class:`~csbluegem.types.Origin`
         Where the sale data originated.
-    pattern_data: Optional[:class:`~csbluegem.types.PatternData`]
-        The pattern data for the item, if available.
-    screenshots: :class:`~csbluegem.types.Screenshots`
-        Screenshot data for the item.
     """
 
     __slots__ = (
@@ -387,56 +505,124 @@ class Sale:
         "type",
         "pattern",
         "price",
-        "timestamp",
+        "_epoch",
+        "_timestamp",
+        "_date",
+        "_is_stattrak",
         "steam_inspect_link",
         "origin",
-        "pattern_data",
-        "screenshots",
+        "_pattern_data",
+        "_raw_pattern_data",
+        "_screenshots",
+        "_raw_screenshots",
     )
 
-    buff_id: int
-    csfloat: str
-    wear: float
-    type: ItemType
-    pattern: int
-    price: float
-    timestamp: datetime.datetime
-    steam_inspect_link: str
-    origin: Origin
-    pattern_data: Optional[PatternData]
-    screenshots: Screenshots
+    def __init__(
+        self,
+        buff_id: int,
+        csfloat: str,
+        wear: float,
+        type: ItemType,
+        pattern: int,
+        price: float,
+        timestamp: datetime.datetime,
+        steam_inspect_link: str,
+        origin: Origin,
+        pattern_data: Optional[PatternData],
+        screenshots: Screenshots,
+    ) -> None:
+        self.buff_id = buff_id
+        self.csfloat = csfloat
+        self.wear = wear
+        self.type = type
+        self.pattern = pattern
+        self.price = price
+        self._epoch = int(timestamp.timestamp())
+        self._timestamp: Optional[datetime.datetime] = timestamp
+        self._date: Optional[datetime.date] = None
+        self._is_stattrak = type is ItemType.StatTrak
+        self.steam_inspect_link = steam_inspect_link
+        self.origin = origin
+        self._pattern_data = pattern_data
+        self._raw_pattern_data: Optional[_APIPatternDataDict] = None
+        self._screenshots: Optional[Screenshots] = screenshots
+        self._raw_screenshots: Optional[_APISearchScreenshotsDict] = None
 
-    @classmethod
-    def _from_data(cls, data: _APISearchSaleDict):
-        buff_id = data["buff_id"]
-        csfloat = data["csfloat"]
-        wear = data["wear"]
-        type = ItemType(data["type"])
-        api_pattern = data["pattern"]
-        price = data["price"]
-        timestamp = parse_epoch(data["epoch"])
-        steam_inspect_link = data["steam_inspect_link"]
-        origin = Origin(data["origin"])
-
-        raw_pattern_data: Optional[_APIPatternDataDict] = data.get("pattern_data")
-        pattern_data = PatternData._from_data(raw_pattern_data) if raw_pattern_data is not None else None
-
-        raw_screenshots_data: _APISearchScreenshotsDict = data["screenshots"]
-        screenshots = Screenshots._from_data(raw_screenshots_data)
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} buff_id={self.buff_id} pattern={self.pattern} wear={self.wear} "
+            f"price={self.price} origin={self.origin!r}>"
+        )
 
-        return cls(
-            buff_id,
-            csfloat,
-            wear,
+    @classmethod
+    def _from_data(
+        cls,
+        data: _APISearchSaleDict,
+        _get_fields=_SALE_FIELDS,
+        _item_types=_ITEM_TYPE_BY_VALUE,
+        _origins=_ORIGIN_BY_VALUE,
+        _stattrak=ItemType.StatTrak,
+    ):
+        # Bypasses __init__ so the timestamp and the nested objects are only built if they are accessed.
+        # The lookup tables are bound as defaults so they are local lookups per sale.
+        self = cls.__new__(cls)
+        (
+            self.buff_id,
+            self.csfloat,
+            self.wear,
             type,
-            api_pattern,
-            price,
-            timestamp,
-            steam_inspect_link,
+            self.pattern,
+            self.price,
+            self._epoch,
+            self.steam_inspect_link,
             origin,
-            pattern_data,
-            screenshots,
-        )
+            self._raw_screenshots,
+        ) = _get_fields(data)
+        self._timestamp = None
+        self._date = None
+        try:
+            self.type = _item_types[type]
+        except KeyError:
+            self.type = ItemType(type)  # raises the usual ValueError
+        self._is_stattrak = self.type is _stattrak
+        try:
+            self.origin = _origins[origin]
+        except KeyError:
+            self.origin = Origin(origin)  # raises the usual ValueError
+
+        self._raw_pattern_data = data.get("pattern_data")
+        self._pattern_data = None
+        self._screenshots = None
+
+        return self
+
+    @property
+    def pattern_data(self) -> Optional[PatternData]:
+        """The pattern data for the item, if available."""
+        raw = self._raw_pattern_data
+        if raw is not None:
+            self._pattern_data = PatternData._from_data(raw)
+            self._raw_pattern_data = None
+
+        return self._pattern_data
+
+    @property
+    def screenshots(self) -> Screenshots:
+        """Screenshot data for the item."""
+        raw = self._raw_screenshots
+        if raw is not None:
+            self._screenshots = Screenshots._from_data(raw)
+            self._raw_screenshots = None
+
+        return self._screenshots  # type: ignore  # set by __init__ or built above
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """When the sale occurred."""
+        if self._timestamp is None:
+            self._timestamp = parse_epoch(self._epoch)
+
+        return self._timestamp
 
     @property
     def float(self):
@@ -446,25 +632,93 @@ class Sale:
     @property
     def date(self) -> datetime.date:
         """The date this item was sold."""
-        return self.timestamp.date()
+        if self._date is None:
+            self._date = self.timestamp.date()
+
+        return self._date
 
     @property
-    def epoch(self) -> float:
+    def epoch(self) -> int:
         """The epoch the item was sold."""
-        return self.timestamp.timestamp()
+        return self._epoch
 
     @property
     def days_since(self) -> int:
         """Returns the number of days since this Sale."""
-        return (utcnow() - self.timestamp).days
+        return int((time.time() - self._epoch) // 86400)
 
     @property
     def is_stattrak(self) -> bool:
         """Whether the item was stattrak"""
-        return self.type is ItemType.StatTrak
+        return self._is_stattrak
+
+
+class SaleColumns:
+    """The numeric fields of a list of :class:`~csbluegem.types.Sale` stored column by column.
+
+    Each column is an :class:`array.array` in the same order as the sales it was built from,
+    so it can be handed to ``numpy.frombuffer`` or other buffer protocol consumers without copying.
+
+    Attributes
+    ----------
+    wear: :class:`array.array`
+        The float of each sale, as doubles.
+    price: :class:`array.array`
+        The price of each sale, as doubles.
+    pattern: :class:`array.array`
+        The pattern of each sale, as signed integers.
+    epoch: :class:`array.array`
+        The epoch of each sale, as signed 64 bit integers.
+    """
+
+    __slots__ = ("wear", "price", "pattern", "epoch")
+
+    def __init__(self, wear: array[float], price: array[float], pattern: array[int], epoch: array[int]) -> None:
+        self.wear = wear
+        self.price = price
+        self.pattern = pattern
+        self.epoch = epoch
+
+    def __len__(self) -> int:
+        return len(self.wear)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={len(self)}>"
+
+    @classmethod
+    def _from_sales(cls, sales: List[Sale], /):
+        return cls(
+            array("d", [s.wear for s in sales]),
+            array("d", [s.price for s in sales]),
+            array("l", [s.pattern for s in sales]),
+            array("q", [s.epoch for s in sales]),
+        )
+
+
+class PriceStats(NamedTuple):
+    """Summary statistics of the prices of a set of sales.
+
+    Attributes
+    ----------
+    size: :class:`int`
+        The number of sales summarised.
+    mean: :class:`float`
+        The mean price.
+    median: :class:`float`
+        The median price.
+    minimum: :class:`float`
+        The lowest price.
+    maximum: :class:`float`
+        The highest price.
+    """
+
+    size: int
+    mean: float
+    median: float
+    minimum: float
+    maximum: float
 
 
-@dataclass
 class SearchResponse:
     """Represents a response to a search query.
 
@@ -473,23 +727,193 @@ class SearchResponse:
     meta: :class:`~csbluegem.types.SearchMeta`
         Metadata about the query.
     sales: List[:class:`~csbluegem.types.Sale`]
-        The sales that were returned.
+        The sales that were returned. Treat this list as read-only, :attr:`columns` is
+        computed from it once and does not see later changes.
     """
 
-    __slots__ = ("meta", "sales")
+    __slots__ = ("meta", "sales", "_columns")
+
+    def __init__(self, meta: SearchMeta, sales: List[Sale]) -> None:
+        self.meta = meta
+        self.sales = sales
+        self._columns: Optional[SaleColumns] = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} meta={self.meta!r} sales={len(self.sales)}>"
+
+    @property
+    def columns(self) -> SaleColumns:
+        """The numeric fields of :attr:`sales` in columnar form. Built on first access and reused afterwards."""
+        if self._columns is None:
+            self._columns = SaleColumns._from_sales(self.sales)
+
+        return self._columns
+
+    def filter_by_wear(self, min: float, max: float) -> List[Sale]:
+        """Returns the sales with a float between ``min`` and ``max``, inclusive.
+
+        Parameters
+        ----------
+        min: :class:`float`
+            The minimum float.
+        max: :class:`float`
+            The maximum float.
+
+        Returns
+        -------
+        List[:class:`~csbluegem.types.Sale`]
+            The matching sales, in their original order.
+        """
+        return [sale for sale in self.sales if min <= sale.wear <= max]
+
+    def filter_by_pattern(self, pattern: int) -> List[Sale]:
+        """Returns the sales with the given pattern.
+
+        Parameters
+        ----------
+        pattern: :class:`int`
+            The pattern to match.
+
+        Returns
+        -------
+        List[:class:`~csbluegem.types.Sale`]
+            The matching sales, in their original order.
+        """
+        return [sale for sale in self.sales if sale.pattern == pattern]
+
+    def price_stats(self, pattern: Optional[int] = None) -> Optional[PriceStats]:
+        """Returns summary statistics of the sale prices.
+
+        Parameters
+        ----------
+        pattern: Optional[:class:`int`], optional
+            Only consider sales with this pattern, by default all sales are considered.
+
+        Returns
+        -------
+        Optional[:class:`~csbluegem.types.PriceStats`]
+            The statistics, or None if there are no matching sales.
+        """
+        if pattern is None:
+            prices = [sale.price for sale in self.sales]
+        else:
+            prices = [sale.price for sale in self.sales if sale.pattern == pattern]
+
+        if not prices:
+            return None
+
+        return PriceStats(len(prices), fmean(prices), median(prices), min(prices), max(prices))
 
-    meta: SearchMeta
-    sales: List[Sale]
+    def days_since_each(self) -> List[int]:
+        """Returns the number of days since each sale, in the same order as :attr:`sales`.
+
+        The current time is sampled once for the whole list, so every value is measured
+        from the same instant.
+
+        Returns
+        -------
+        List[:class:`int`]
+            The number of whole days since each sale.
+        """
+        now = time.time()
+        return [int((now - sale._epoch) // 86400) for sale in self.sales]
 
     @classmethod
     def _from_data(cls, data: _APISearchResponseDict):
         meta = SearchMeta._from_data(data["meta"])
-        sales = [Sale._from_data(d) for d in data["sales"]]
+        sales = list(map(Sale._from_data, data["sales"]))
 
         return cls(meta, sales)
 
 
-@dataclass
+class PatternDataColumns:
+    """The measurements of a list of :class:`~csbluegem.types.PatternData` stored column by column.
+
+    Each column is an :class:`array.array` in the same order as the pattern data it was built
+    from, so it can be scanned or ranked without touching the individual rows, or handed to
+    ``numpy.frombuffer`` without copying. Every column is stored as doubles, region counts
+    included, as the API does not always send those as integers.
+
+    Attributes
+    ----------
+    backside_blue: :class:`array.array`
+        The percentage of blue visible on the back side.
+    backside_contour_blue: :class:`array.array`
+        The number of individual blue sections visible on the back side.
+    backside_contour_purple: :class:`array.array`
+        The number of individual purple sections visible on the back side.
+    backside_gold: :class:`array.array`
+        The percentage of gold visible on the back side.
+    backside_purple: :class:`array.array`
+        The percentage of purple visible on the back side.
+    playside_blue: :class:`array.array`
+        The percentage of blue visible on the play side.
+    playside_contour_blue: :class:`array.array`
+        The number of individual blue sections visible on the play side.
+    playside_contour_purple: :class:`array.array`
+        The number of individual purple sections visible on the play side.
+    playside_gold: :class:`array.array`
+        The percentage of gold visible on the play side.
+    playside_purple: :class:`array.array`
+        The percentage of purple visible on the play side.
+    """
+
+    __slots__ = (
+        "backside_blue",
+        "backside_contour_blue",
+        "backside_contour_purple",
+        "backside_gold",
+        "backside_purple",
+        "playside_blue",
+        "playside_contour_blue",
+        "playside_contour_purple",
+        "playside_gold",
+        "playside_purple",
+    )
+
+    # Fetches the measurements of a PatternData row, in slot order.
+    _get_measurements = attrgetter(*__slots__)
+
+    def __init__(
+        self,
+        backside_blue: array[float],
+        backside_contour_blue: array[float],
+        backside_contour_purple: array[float],
+        backside_gold: array[float],
+        backside_purple: array[float],
+        playside_blue: array[float],
+        playside_contour_blue: array[float],
+        playside_contour_purple: array[float],
+        playside_gold: array[float],
+        playside_purple: array[float],
+    ) -> None:
+        self.backside_blue = backside_blue
+        self.backside_contour_blue = backside_contour_blue
+        self.backside_contour_purple = backside_contour_purple
+        self.backside_gold = backside_gold
+        self.backside_purple = backside_purple
+        self.playside_blue = playside_blue
+        self.playside_contour_blue = playside_contour_blue
+        self.playside_contour_purple = playside_contour_purple
+        self.playside_gold = playside_gold
+        self.playside_purple = playside_purple
+
+    def __len__(self) -> int:
+        return len(self.backside_blue)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={len(self)}>"
+
+    @classmethod
+    def _from_pattern_data(cls, pattern_data: List[PatternData], /):
+        if not pattern_data:
+            return cls(*(array("d") for _ in cls.__slots__))
+
+        # Only the measurements are transposed, pattern, quantity and the nested objects are never read.
+        columns = zip(*map(cls._get_measurements, pattern_data))
+        return cls(*(array("d", column) for column in columns))
+
+
 class PatternDataResponse:
     """Represents a response to a pattern data query.
 
@@ -498,40 +922,59 @@ class PatternDataResponse:
     meta: :class:`~csbluegem.types.SearchMeta`
         Metadata about the query.
     data: List[:class:`~csbluegem.types.PatternData`]
-        The pattern datas that were returned.
+        The pattern datas that were returned. Treat this list as read-only, :attr:`columns` is
+        computed from it once and does not see later changes.
     """
 
-    __slots__ = ("meta", "pattern_data")
+    __slots__ = ("meta", "pattern_data", "_columns")
 
-    meta: SearchMeta
-    pattern_data: List[PatternData]
+    def __init__(self, meta: SearchMeta, pattern_data: List[PatternData]) -> None:
+        self.meta = meta
+        self.pattern_data = pattern_data
+        self._columns: Optional[PatternDataColumns] = None
 
-    @classmethod
-    def _from_data(cls, api_data: _APIPatternDataResponseDict):
-        meta = SearchMeta._from_data(api_data["meta"])
-        pattern_data = [PatternData._from_data(d) for d in api_data["data"]]
+    @property
+    def columns(self) -> PatternDataColumns:
+        """The measurements of :attr:`pattern_data` in columnar form. Built on first access and reused afterwards."""
+        if self._columns is None:
+            self._columns = PatternDataColumns._from_pattern_data(self.pattern_data)
 
-        return cls(meta, pattern_data)
+        return self._columns
 
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} meta={self.meta!r} pattern_data={len(self.pattern_data)}>"
 
-class Origin(Enum):
-    """Where a :class:`~csbluegem.types.Sale` originated from."""
+    def filter_by(self, *filters: Filter) -> List[PatternData]:
+        """Returns the pattern data matching every given filter, without another request.
 
-    # fmt: off
-    Buff     = "Buff"
-    CSFloat  = "CSFloat"
-    SkinBid  = "SkinBid"
-    BroSkins = "BroSkins"
-    Skinport = "Skinport"
-    C5Game   = "c5game"
-    # fmt: on
+        Parameters
+        ----------
+        *filters: :class:`~csbluegem.types.Filter`
+            The filters to apply. Bounds are inclusive.
 
-    def __str__(self) -> str:
-        """Returns the value of the member."""
-        return self.value
+        Returns
+        -------
+        List[:class:`~csbluegem.types.PatternData`]
+            The matching pattern data, in their original order.
+        """
+        result = self.pattern_data
+        for filter in filters:
+            # FilterType values are PatternData field names.
+            get = attrgetter(filter.type.value)
+            lo, hi = filter.min, filter.max
+            result = [pd for pd in result if lo <= get(pd) <= hi]
+
+        return list(result)
 
+    @classmethod
+    def _from_data(cls, api_data: _APIPatternDataResponseDict):
+        meta = SearchMeta._from_data(api_data["meta"])
+        pattern_data = list(map(PatternData._from_data, api_data["data"]))
+
+        return cls(meta, pattern_data)
 
-class FilterType(Enum):
+
+class FilterType(_StrEnum):
     """What a :class:`~csbluegem.types.Filter` should filter by."""
 
     # fmt: off
@@ -555,15 +998,34 @@ class Filter:
         The minimum value for this filter.
     max: :class:`float`
         The maximum value for this filter.
+
+    Raises
+    ------
+    BadArgument
+        The range is not within 0-100 or ``min`` is not below ``max``.
     """
 
-    __slots__ = ("type", "min", "max")
+    __slots__ = ("_type", "min", "max", "_min_param", "_max_param")
 
     def __init__(self, type: FilterType, min: float, max: float):
+        if not 0 <= min < max <= 100:
+            raise BadArgument(f"invalid filter range for {type}: {min}-{max}")
+
         self.type = type
         self.min = min
         self.max = max
 
+    @property
+    def type(self) -> FilterType:
+        return self._type
+
+    @type.setter
+    def type(self, value: FilterType) -> None:
+        # The query parameter names are built once here rather than on every search.
+        self._type = value
+        self._min_param = value.value + "_min"
+        self._max_param = value.value + "_max"
+
     def is_valid(self) -> bool:
         """Whether or not this Filter is valid.
 
@@ -572,7 +1034,7 @@ class Filter:
         :class:`bool`
             Filter validity.
         """
-        return (0 <= self.min < 100 and 0 < self.max <= 100) and self.max > self.min
+        return 0 <= self.min < self.max <= 100
 
     def __str__(self) -> str:
         return f"{self.type.value} {self.min}-{self.max}"
@@ -581,7 +1043,7 @@ class Filter:
         return f"<{self.__class__.__name__} type={self.type} min={self.min} max={self.max}>"
 
 
-class Order(Enum):
+class Order(_StrEnum):
     """How query results should be ordered."""
 
     # fmt: off
@@ -590,16 +1052,7 @@ class Order(Enum):
     # fmt: on
 
 
-class ItemType(Enum):
-    """The type of an item."""
-
-    # fmt: off
-    StatTrak = "stattrak"
-    Normal   = "normal"
-    # fmt: on
-
-
-class Currency(Enum):
+class Currency(_StrEnum):
     """Available currencies for use in the API."""
 
     USD = "USD"
@@ -611,7 +1064,7 @@ class Currency(Enum):
     CAD = "CAD"
 
 
-class SortKey(Enum):
+class SortKey(_StrEnum):
     """How the results of a query should be sorted."""
 
     # fmt: off
@@ -632,7 +1085,7 @@ class SortKey(Enum):
     # fmt: on
 
 
-class Item(Enum):
+class Item(_StrEnum):
     """Items that can be queried from the API."""
 
     # fmt: off
@@ -23,8 +23,9 @@ SOFTWARE.
 from __future__ import annotations
 
 import datetime
+import sys
 from itertools import islice
-from typing import Any, Coroutine, Dict, Generator, Iterable, Optional, Tuple, TypeVar
+from typing import Any, Callable, Coroutine, Dict, Generator, Iterable, Iterator, Optional, Tuple, TypeVar
 
 __all__ = (
     "utcnow",
@@ -36,13 +37,27 @@ T = TypeVar("T")
 Coro = Coroutine[Any, Any, T]
 
 
+_UTC = datetime.timezone.utc
+
+
 def parse_date(date_string: str, /) -> datetime.datetime:
     """Returns an aware datetime denoting the date string given"""
-    return datetime.datetime.strptime(date_string, "%Y-%m-%d").replace(tzinfo=datetime.timezone.utc)
+    return datetime.datetime.strptime(date_string, "%Y-%m-%d").replace(tzinfo=_UTC)
 
 
 def parse_epoch(epoch: int, /) -> datetime.datetime:
-    return datetime.datetime.fromtimestamp(epoch, tz=datetime.timezone.utc)
+    return datetime.datetime.fromtimestamp(epoch, tz=_UTC)
+
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=_UTC)
+
+
+def to_epoch(dt: datetime.datetime, /) -> int:
+    """Returns the whole seconds since the unix epoch for a datetime, naive datetimes are treated as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+
+    return int((dt - _EPOCH).total_seconds())
 
 
 def utcnow() -> datetime.datetime:
@@ -53,7 +68,15 @@ def utcnow() -> datetime.datetime:
     :class:`datetime.datetime`
         The current aware datetime in UTC.
     """
-    return datetime.datetime.now(datetime.timezone.utc)
+    return datetime.datetime.now(_UTC)
+
+
+_batched: Optional[Callable[[Iterable[Any], int], Iterator[Tuple[Any, ...]]]]
+
+if sys.version_info >= (3, 12):
+    from itertools import batched as _batched
+else:
+    _batched = None
 
 
 # From the python docs for 3.12s `itertools.batched`
@@ -74,11 +97,30 @@ def as_chunks(iterable: Iterable[T], n: int) -> Generator[Tuple[T, ...], None, N
     """
     if n < 1:
         raise ValueError("n must be at least one")
+
+    # Sequences are sliced directly rather than stepped through one element at a time.
+    if isinstance(iterable, tuple):
+        for i in range(0, len(iterable), n):
+            yield iterable[i : i + n]
+        return
+
+    if isinstance(iterable, list):
+        for i in range(0, len(iterable), n):
+            yield tuple(iterable[i : i + n])
+        return
+
+    if _batched is not None:
+        yield from _batched(iterable, n)
+        return
+
     it = iter(iterable)
     while batch := tuple(islice(it, n)):
         yield batch
 
 
+_MISSING: Any = object()
+
+
 def safe_get(dict_: Dict[Any, Any], *keys: Any) -> Optional[Any]:
     """Safely get a nested key from a dictionary.
 
@@ -110,17 +152,26 @@ def safe_get(dict_: Dict[Any, Any], *keys: Any) -> Optional[Any]:
         The value at the key. None if the key could not be gotten.
     """
     for key in keys:
-        try:
-            dict_ = dict_[key]
-        except KeyError:
-            return None
+        # Plain dicts skip the exception machinery, anything else (lists, other mappings) is subscripted as before.
+        if type(dict_) is dict:
+            dict_ = dict_.get(key, _MISSING)
+            if dict_ is _MISSING:
+                return None
+        else:
+            try:
+                dict_ = dict_[key]
+            except KeyError:
+                return None
 
     return dict_
 
 
+_MIN_WEAR = 0.0000000000001
+
+
 def is_valid_pattern(pattern: Optional[int]) -> bool:
-    return 0 <= pattern <= 1000 if pattern is not None else True
+    return pattern is None or 0 <= pattern <= 1000
 
 
 def is_valid_wear(flt: float) -> bool:
-    return 0.0000000000001 <= flt <= 1
+    return _MIN_WEAR <= flt <= 1